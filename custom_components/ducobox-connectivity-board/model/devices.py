@@ -22,9 +22,12 @@ from .utils import (
     extract_val,
 )
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache, partial
 import logging
+import re
+from types import MappingProxyType
 from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorDeviceClass,
@@ -523,6 +526,11 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
     ),
 )
 
+# Read-only index of SENSORS by description key.
+SENSORS_BY_KEY: Mapping[str, DucoboxSensorEntityDescription] = MappingProxyType(
+    {description.key: description for description in SENSORS}
+)
+
 
 # ---------------------------------------------------------------------------
 # Node-level sensor auto-discovery
@@ -666,18 +674,27 @@ NODE_SENSOR_REGISTRY: dict[str, dict[str, NodeSensorMeta]] = {
     },
 }
 
+# Read-only flat view of NODE_SENSOR_REGISTRY keyed by (module, key), so
+# discovery resolves a key's metadata with a single lookup.
+NODE_SENSOR_REGISTRY_FLAT: Mapping[tuple[str, str], NodeSensorMeta] = MappingProxyType({
+    (module, key): meta
+    for module, metas in NODE_SENSOR_REGISTRY.items()
+    for key, meta in metas.items()
+})
+
+
+# Word boundaries in a CamelCase key: lowercase→uppercase ('FlowLvl'), and
+# the end of an acronym before a capitalised word ('RSSIWifi').
+_CAMEL_BOUNDARY = re.compile(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+
 
+@lru_cache(maxsize=512)
 def _humanize_key(key: str) -> str:
     """Convert a CamelCase key to a human-readable name.
 
     E.g. 'FlowLvlTgt' -> 'Flow Lvl Tgt'
     """
-    import re
-    # Insert space before uppercase letters that follow lowercase letters
-    name = re.sub(r'([a-z])([A-Z])', r'\1 \2', key)
-    # Insert space before uppercase letters followed by lowercase (handles acronyms)
-    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1 \2', name)
-    return name
+    return _CAMEL_BOUNDARY.sub(' ', key)
 
 
 def discover_node_sensors(
@@ -706,8 +723,6 @@ def discover_node_sensors(
         if not isinstance(module_data, dict):
             continue
 
-        registry = NODE_SENSOR_REGISTRY.get(module, {})
-
         for key, value in module_data.items():
             # Only consider keys whose value is a dict with 'Val'
             if not isinstance(value, dict) or 'Val' not in value:
@@ -717,7 +732,7 @@ def discover_node_sensors(
             if module == 'General' and key in _general_skip_keys:
                 continue
 
-            meta = registry.get(key)
+            meta = NODE_SENSOR_REGISTRY_FLAT.get((module, key))
             sensor_key = f"{module}_{key}"
 
             if meta is not None:
@@ -775,17 +790,23 @@ def _make_value_fn_processed(
     module: str, key: str, process_fn: Callable
 ) -> Callable[[dict], float | None]:
     """Create a value_fn that extracts Val and applies a processing function."""
-    def value_fn(node: dict) -> float | None:
-        raw = safe_get(node, module, key)
-        return process_fn(extract_val(raw))
-    return value_fn
+    return partial(_processed_node_val, process_fn, module, key)
 
 
 def _make_value_fn_raw(
     module: str, key: str
 ) -> Callable[[dict], float | None]:
     """Create a value_fn that just extracts the Val."""
-    def value_fn(node: dict) -> float | None:
-        raw = safe_get(node, module, key)
-        return extract_val(raw)
-    return value_fn
+    return partial(_node_val, module, key)
+
+
+def _node_val(module: str, key: str, node: dict) -> float | None:
+    """Extract the Val of node[module][key]."""
+    return extract_val(safe_get(node, module, key))
+
+
+def _processed_node_val(
+    process_fn: Callable, module: str, key: str, node: dict
+) -> float | None:
+    """Extract the Val of node[module][key] and apply process_fn to it."""
+    return process_fn(extract_val(safe_get(node, module, key)))
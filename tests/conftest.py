@@ -11,11 +11,12 @@ auto-discovery, coordinator data flow) without pulling in the entire HA core.
 
 from __future__ import annotations
 
+import copy
 import sys
 import types
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, NamedTuple
 from unittest.mock import AsyncMock, MagicMock
 import pytest
 
@@ -249,9 +250,14 @@ for sub_name in ("utils", "devices", "coordinator"):
 
 # ───────────────────────────────────────────────────────────────────────
 # 3.  Realistic API response fixtures (captured from a live Ducobox)
+#
+#     These are session-scoped and shared by every test, so tests must treat
+#     them as read-only.  Tests that need data with a piece missing use the
+#     ``coordinator_data_no_*`` variants; tests that modify the data use
+#     ``coordinator_data_mut``, which hands out a private deep copy.
 # ───────────────────────────────────────────────────────────────────────
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_info_response() -> dict:
     """Full /info response from a Ducobox Energy Comfort (anonymized)."""
     return {
@@ -342,7 +348,7 @@ def api_info_response() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_nodes_response() -> list[dict]:
     """Full /info/nodes → Nodes list (anonymized)."""
     return [
@@ -488,7 +494,7 @@ def api_nodes_response() -> list[dict]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_config_nodes_response() -> dict:
     """/config/nodes response (anonymized)."""
     return {
@@ -510,7 +516,7 @@ def api_config_nodes_response() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_config_response() -> dict:
     """Full /config response (anonymized)."""
     return {
@@ -594,7 +600,7 @@ def api_config_response() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_action_response() -> dict:
     """Full /action response (anonymized)."""
     return {
@@ -608,7 +614,7 @@ def api_action_response() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_action_nodes_response() -> dict:
     """Full /action/nodes response (anonymized)."""
     return {
@@ -635,7 +641,7 @@ def api_action_nodes_response() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def coordinator_data(api_info_response, api_nodes_response, api_config_nodes_response,
                      api_config_response, api_action_response, api_action_nodes_response) -> dict:
     """Combined data dict as the coordinator would produce."""
@@ -657,3 +663,73 @@ def coordinator_data(api_info_response, api_nodes_response, api_config_nodes_res
         data['mappings']['node_id_to_name'][nid] = f"{nid}:{ntype}"
         data['mappings']['node_id_to_type'][nid] = ntype
     return data
+
+
+@pytest.fixture
+def coordinator_data_mut(coordinator_data) -> dict:
+    """A deep copy of ``coordinator_data`` that a test may modify freely."""
+    return copy.deepcopy(coordinator_data)
+
+
+# Read-only variants of ``coordinator_data`` for the "missing data" tests.
+# They share every untouched sub-dict with the original, so they are cheap to
+# build once per session and must not be modified either.
+
+@pytest.fixture(scope="session")
+def coordinator_data_no_nightboost(coordinator_data) -> dict:
+    """``coordinator_data`` without the ``info.NightBoost`` section."""
+    info = {k: v for k, v in coordinator_data['info'].items() if k != 'NightBoost'}
+    return {**coordinator_data, 'info': info}
+
+
+@pytest.fixture(scope="session")
+def coordinator_data_no_mac(coordinator_data) -> dict:
+    """``coordinator_data`` whose LAN MAC address is unknown."""
+    info = coordinator_data['info']
+    general = info['General']
+    lan = {**general['Lan'], 'Mac': {'Val': None}}
+    return {**coordinator_data, 'info': {**info, 'General': {**general, 'Lan': lan}}}
+
+
+@pytest.fixture(scope="session")
+def coordinator_data_no_nodes(coordinator_data) -> dict:
+    """``coordinator_data`` with no node list."""
+    return {**coordinator_data, 'nodes': None}
+
+
+class Discovered(NamedTuple):
+    """Node sensor discovery result with precomputed lookups."""
+
+    descriptions: list
+    keys: frozenset[str]
+    by_key: dict[str, Any]
+
+
+@pytest.fixture(scope="session")
+def discovered():
+    """Memoized ``discover_node_sensors`` for the ``api_nodes_response`` nodes.
+
+    Returns a :class:`Discovered` per node, so tests get the key set and the
+    ``sensor_key`` index without rebuilding them.  Nodes built inside a single
+    test should call ``discover_node_sensors`` directly instead.  Sharing is
+    safe because the descriptions are frozen dataclasses.
+    """
+    from custom_components.ducobox_connectivity_board.model.devices import (
+        discover_node_sensors,
+    )
+
+    cache: dict[int, tuple[dict, Discovered]] = {}
+
+    def get(node: dict) -> Discovered:
+        hit = cache.get(id(node))
+        if hit is None or hit[0] is not node:
+            descriptions = discover_node_sensors(node)
+            result = Discovered(
+                descriptions,
+                frozenset(d.sensor_key for d in descriptions),
+                {d.sensor_key: d for d in descriptions},
+            )
+            hit = cache[id(node)] = (node, result)
+        return hit[1]
+
+    return get
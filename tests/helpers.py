@@ -0,0 +1,19 @@
+"""Assertion and setup helpers shared by the platform tests."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+
+def assert_all_unique(ids: Iterable[str]) -> None:
+    """Assert that no id occurs more than once, listing any duplicates."""
+    duplicates = [uid for uid, count in Counter(ids).items() if count > 1]
+    assert not duplicates, f"Duplicate unique IDs found: {duplicates}"
+
+
+async def collect_entities(setup_fn, hass, entry) -> list:
+    """Run a platform's ``async_setup_entry`` and return the entities it adds."""
+    added_entities = []
+    await setup_fn(hass, entry, added_entities.extend)
+    return added_entities
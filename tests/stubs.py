@@ -0,0 +1,38 @@
+"""Lightweight test doubles shared by the platform tests.
+
+Plain classes are cheaper to build than ``MagicMock``/``AsyncMock`` trees
+and keep the recorded interactions explicit.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class StubCoordinator:
+    """Stand-in for ``DucoboxCoordinator`` that records its async calls.
+
+    Each call is appended to ``calls`` as ``(name, args, kwargs)``.
+    """
+
+    __slots__ = ('data', 'last_update_success', 'calls')
+
+    def __init__(self, data: dict[str, Any], last_update_success: bool = True) -> None:
+        self.data = data
+        self.last_update_success = last_update_success
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    async def async_set_value(self, *args, **kwargs) -> None:
+        self.calls.append(('async_set_value', args, kwargs))
+
+    async def async_set_box_config(self, *args, **kwargs) -> None:
+        self.calls.append(('async_set_box_config', args, kwargs))
+
+    async def async_set_ventilation_state(self, *args, **kwargs) -> None:
+        self.calls.append(('async_set_ventilation_state', args, kwargs))
+
+    async def async_execute_action(self, *args, **kwargs) -> None:
+        self.calls.append(('async_execute_action', args, kwargs))
+
+    async def async_request_refresh(self) -> None:
+        self.calls.append(('async_request_refresh', (), {}))
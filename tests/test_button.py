@@ -1,7 +1,7 @@
 """Tests for button.py — button platform entities."""
 
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 
 from custom_components.ducobox_connectivity_board.button import (
     async_setup_entry,
@@ -9,98 +9,102 @@ from custom_components.ducobox_connectivity_board.button import (
     BOX_BUTTONS,
 )
 from custom_components.ducobox_connectivity_board.const import DOMAIN
+from tests.helpers import assert_all_unique, collect_entities
+from tests.stubs import StubCoordinator
 
 
-@pytest.fixture
+_ENTRY_ID = 'test_entry_123'
+
+
+def _make_hass(coordinator):
+    hass = MagicMock()
+    hass.data = {DOMAIN: {_ENTRY_ID: {'coordinator': coordinator}}}
+    return hass, _ENTRY_ID
+
+
+@pytest.fixture(scope="module")
 def mock_coordinator(coordinator_data):
-    coord = MagicMock()
-    coord.data = coordinator_data
-    coord.last_update_success = True
-    coord.async_execute_action = AsyncMock()
-    return coord
+    """Coordinator shared by the module; its data must not be modified."""
+    return StubCoordinator(coordinator_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_hass(mock_coordinator):
-    hass = MagicMock()
-    entry_id = 'test_entry_123'
-    hass.data = {DOMAIN: {entry_id: {'coordinator': mock_coordinator}}}
-    return hass, entry_id
+    return _make_hass(mock_coordinator)
 
 
-@pytest.fixture
-def mock_entry(mock_hass):
-    hass, entry_id = mock_hass
+@pytest.fixture(scope="module")
+def mock_entry():
     entry = MagicMock()
-    entry.entry_id = entry_id
+    entry.entry_id = _ENTRY_ID
     return entry
 
 
-class TestButtonSetupEntry:
+@pytest.fixture(scope="module")
+async def button_entities(mock_hass, mock_entry):
+    """Entities from a single async_setup_entry run, shared by the module."""
+    hass, _ = mock_hass
+    return await collect_entities(async_setup_entry, hass, mock_entry)
 
-    @pytest.mark.asyncio
-    async def test_creates_button_entities(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+@pytest.fixture
+def fresh_coordinator(coordinator_data):
+    """Per-test coordinator with an empty call log, for tests that press buttons."""
+    return StubCoordinator(coordinator_data)
 
-        assert len(added_entities) > 0
-        for entity in added_entities:
-            assert isinstance(entity, DucoboxButtonEntity)
 
-    @pytest.mark.asyncio
-    async def test_only_creates_available_actions(self, mock_hass, mock_entry, mock_coordinator):
-        """Only actions present in the API response are created."""
-        hass, _ = mock_hass
-        added_entities = []
+@pytest.fixture
+async def fresh_by_action(fresh_coordinator, mock_entry):
+    """Buttons created over fresh_coordinator, keyed by API action."""
+    hass, _ = _make_hass(fresh_coordinator)
+    entities = await collect_entities(async_setup_entry, hass, mock_entry)
+    return {e.entity_description.action: e for e in entities}
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
 
-        # The fixture has 5 actions: ResetFilterTimeRemain, UpdateNodeData,
-        # ReconnectWifi, ScanWifi, RebootBox
-        # But BOX_BUTTONS only defines 4 safe ones (no RebootBox)
-        assert len(added_entities) == 4
+@pytest.fixture
+def mock_coordinator_mut(coordinator_data_mut):
+    """Per-test coordinator over a private copy of the data, for tests that modify it."""
+    return StubCoordinator(coordinator_data_mut)
 
-    @pytest.mark.asyncio
-    async def test_skips_on_unknown_mac(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        mock_coordinator.data['info']['General']['Lan']['Mac'] = {'Val': None}
-        added_entities = []
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+@pytest.fixture
+def mock_hass_mut(mock_coordinator_mut):
+    return _make_hass(mock_coordinator_mut)
 
-        assert len(added_entities) == 0
 
-    @pytest.mark.asyncio
-    async def test_unique_ids(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
+class TestButtonSetupEntry:
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    def test_creates_button_entities(self, button_entities):
+        assert len(button_entities) > 0
+        for entity in button_entities:
+            assert isinstance(entity, DucoboxButtonEntity)
 
-        unique_ids = [e._attr_unique_id for e in added_entities]
-        assert len(unique_ids) == len(set(unique_ids))
+    def test_only_creates_available_actions(self, button_entities):
+        """Only actions present in the API response are created."""
+        # The fixture has 5 actions: ResetFilterTimeRemain, UpdateNodeData,
+        # ReconnectWifi, ScanWifi, RebootBox
+        # But BOX_BUTTONS only defines 4 safe ones (no RebootBox)
+        assert len(button_entities) == 4
 
-    @pytest.mark.asyncio
-    async def test_press_calls_execute_action(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
+    async def test_skips_on_unknown_mac(self, coordinator_data_no_mac, mock_entry):
+        hass, _ = _make_hass(StubCoordinator(coordinator_data_no_mac))
+        added_entities = await collect_entities(async_setup_entry, hass, mock_entry)
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+        assert len(added_entities) == 0
 
-        # Find the ResetFilterTimeRemain button
-        reset_btn = next(e for e in added_entities if 'reset_filter' in e._attr_unique_id)
-        await reset_btn.async_press()
+    def test_unique_ids(self, button_entities):
+        assert_all_unique(e._attr_unique_id for e in button_entities)
 
-        mock_coordinator.async_execute_action.assert_called_once_with('ResetFilterTimeRemain')
+    async def test_press_calls_execute_action(self, fresh_by_action, fresh_coordinator):
+        await fresh_by_action['ResetFilterTimeRemain'].async_press()
 
-    @pytest.mark.asyncio
-    async def test_no_entities_when_no_actions(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        mock_coordinator.data['action'] = {}
-        added_entities = []
+        assert fresh_coordinator.calls == [
+            ('async_execute_action', ('ResetFilterTimeRemain',), {}),
+        ]
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    async def test_no_entities_when_no_actions(self, mock_hass_mut, mock_entry, mock_coordinator_mut):
+        hass, _ = mock_hass_mut
+        mock_coordinator_mut.data['action'] = {}
+        added_entities = await collect_entities(async_setup_entry, hass, mock_entry)
 
         assert len(added_entities) == 0
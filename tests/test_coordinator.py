@@ -5,6 +5,8 @@ We test the data-fetching logic, mapping generation, and entity value
 extraction.
 """
 
+import json
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from custom_components.ducobox_connectivity_board.model.coordinator import (
@@ -15,7 +17,7 @@ from custom_components.ducobox_connectivity_board.model.coordinator import (
 from custom_components.ducobox_connectivity_board.model.devices import (
     DucoboxSensorEntityDescription,
     DucoboxNodeSensorEntityDescription,
-    SENSORS,
+    SENSORS_BY_KEY,
     discover_node_sensors,
 )
 
@@ -56,10 +58,21 @@ def mock_hass():
     return hass
 
 
+@pytest.fixture(scope="module")
+def _coordinator_singleton():
+    """One DucoboxCoordinator shared by every test in this module."""
+    return DucoboxCoordinator(MagicMock(), None)
+
+
 @pytest.fixture
-def coordinator(mock_hass, mock_duco_client):
-    """A DucoboxCoordinator with mocked deps."""
-    coord = DucoboxCoordinator(mock_hass, mock_duco_client)
+def coordinator(_coordinator_singleton, mock_hass, mock_duco_client):
+    """The shared DucoboxCoordinator, reset and wired to this test's mocks."""
+    coord = _coordinator_singleton
+    coord.hass = mock_hass
+    coord.duco_client = mock_duco_client
+    coord._static_data = None
+    coord.data = {}
+    coord.last_update_success = True
     return coord
 
 
@@ -111,29 +124,27 @@ class TestFetchData:
         assert isinstance(data['nodes'], list)
         assert len(data['nodes']) == len(api_nodes_response)
 
-    def test_mappings_built_correctly(self, coordinator):
+    @pytest.fixture
+    def mappings(self, coordinator):
         coordinator._static_data = coordinator._fetch_once_data()
-        data = coordinator._fetch_data()
-
-        mappings = data['mappings']
-        # Node 1 = BOX
-        assert mappings['node_id_to_type'][1] == 'BOX'
-        assert '1:BOX' == mappings['node_id_to_name'][1]
+        return coordinator._fetch_data()['mappings']
 
-        # Node 3 = UCCO2
-        assert mappings['node_id_to_type'][3] == 'UCCO2'
+    @pytest.mark.parametrize("node_id,node_type", [(1, 'BOX'), (3, 'UCCO2'), (58, 'BSRH')])
+    def test_node_type_mapping(self, mappings, node_id, node_type):
+        assert mappings['node_id_to_type'][node_id] == node_type
 
-        # Node 58 = BSRH
-        assert mappings['node_id_to_type'][58] == 'BSRH'
+    def test_node_name_mapping(self, mappings):
+        assert mappings['node_id_to_name'][1] == '1:BOX'
 
     def test_handles_empty_nodes(self, coordinator):
         coordinator._static_data = coordinator._fetch_once_data()
-        coordinator.duco_client.raw_get = MagicMock(side_effect=lambda ep: {
+        empty = {
             '/info': {},
             '/info/nodes': {},  # no 'Nodes' key
             '/config/nodes': {},
             '/config': {},
-        }[ep])
+        }
+        coordinator.duco_client.raw_get = empty.__getitem__
 
         data = coordinator._fetch_data()
         assert data['nodes'] == []
@@ -156,7 +167,7 @@ class TestDucoboxSensorEntity:
         coordinator.data = coordinator_data
         coordinator.last_update_success = True
 
-        desc = next(s for s in SENSORS if s.key == 'TempOda')
+        desc = SENSORS_BY_KEY['TempOda']
         device_info = {'name': 'test_device', 'identifiers': {('ducobox', 'test')}}
 
         return DucoboxSensorEntity(
@@ -189,9 +200,9 @@ class TestDucoboxSensorEntity:
 class TestDucoboxNodeSensorEntity:
 
     @pytest.fixture
-    def node_entity(self, coordinator, coordinator_data, api_nodes_response):
+    def node_entity(self, coordinator, coordinator_data_mut, api_nodes_response):
         """A node sensor entity for node 3 (UCCO2) CO₂ sensor."""
-        coordinator.data = coordinator_data
+        coordinator.data = coordinator_data_mut
         coordinator.last_update_success = True
 
         node = api_nodes_response[2]  # UCCO2
@@ -232,28 +243,21 @@ class TestDucoboxNodeSensorEntity:
 
 class TestAsyncSetValue:
 
-    @pytest.mark.asyncio
     async def test_patches_config(self, coordinator, mock_duco_client, mock_hass):
         await coordinator.async_set_value(node_id=3, key='Co2SetPoint', value=1200)
 
         mock_duco_client.raw_patch.assert_called_once()
-        call_args = mock_duco_client.raw_patch.call_args
-        assert '/config/nodes/3' in call_args[0][0]
+        url, body = mock_duco_client.raw_patch.call_args.args
+        assert '/config/nodes/3' in url
         # The JSON body should contain the key and rounded value
-        import json
-        body = json.loads(call_args[0][1])
-        assert body['Co2SetPoint']['Val'] == 1200
+        assert json.loads(body)['Co2SetPoint']['Val'] == 1200
 
-    @pytest.mark.asyncio
     async def test_rounds_value(self, coordinator, mock_duco_client, mock_hass):
         await coordinator.async_set_value(node_id=1, key='FlowLvlAutoMin', value=35.7)
 
-        body_str = mock_duco_client.raw_patch.call_args[0][1]
-        import json
-        body = json.loads(body_str)
-        assert body['FlowLvlAutoMin']['Val'] == 36
+        _, body = mock_duco_client.raw_patch.call_args.args
+        assert json.loads(body)['FlowLvlAutoMin']['Val'] == 36
 
-    @pytest.mark.asyncio
     async def test_raises_on_failure(self, coordinator, mock_duco_client, mock_hass):
         mock_duco_client.raw_patch.side_effect = Exception("connection refused")
 
@@ -265,7 +269,6 @@ class TestAsyncSetValue:
 
 class TestAsyncSetVentilationState:
 
-    @pytest.mark.asyncio
     async def test_calls_change_action(self, coordinator, mock_duco_client, mock_hass):
         await coordinator.async_set_ventilation_state(
             node_id=1, option='MAN1', action='SetVentilationState'
@@ -275,7 +278,6 @@ class TestAsyncSetVentilationState:
             'SetVentilationState', 'MAN1', 1
         )
 
-    @pytest.mark.asyncio
     async def test_raises_on_failure(self, coordinator, mock_duco_client, mock_hass):
         mock_duco_client.change_action_node.side_effect = Exception("timeout")
 
@@ -287,18 +289,14 @@ class TestAsyncSetVentilationState:
 
 class TestAsyncSetBoxConfig:
 
-    @pytest.mark.asyncio
     async def test_patches_config(self, coordinator, mock_duco_client, mock_hass):
         await coordinator.async_set_box_config('HeatRecovery', 'Bypass', 'TimeFilter', 200)
 
         mock_duco_client.raw_patch.assert_called_once()
-        call_args = mock_duco_client.raw_patch.call_args
-        assert call_args[0][0] == '/config'
-        import json
-        body = json.loads(call_args[0][1])
-        assert body['HeatRecovery']['Bypass']['TimeFilter']['Val'] == 200
+        url, body = mock_duco_client.raw_patch.call_args.args
+        assert url == '/config'
+        assert json.loads(body)['HeatRecovery']['Bypass']['TimeFilter']['Val'] == 200
 
-    @pytest.mark.asyncio
     async def test_raises_on_failure(self, coordinator, mock_duco_client, mock_hass):
         mock_duco_client.raw_patch.side_effect = Exception("connection refused")
 
@@ -310,25 +308,20 @@ class TestAsyncSetBoxConfig:
 
 class TestAsyncExecuteAction:
 
-    @pytest.mark.asyncio
     async def test_executes_action_no_value(self, coordinator, mock_duco_client, mock_hass):
         await coordinator.async_execute_action('ResetFilterTimeRemain')
 
         mock_duco_client.raw_patch.assert_called_once()
-        call_args = mock_duco_client.raw_patch.call_args
-        assert call_args[0][0] == '/action/ResetFilterTimeRemain'
-        assert call_args[0][1] is None
+        url, body = mock_duco_client.raw_patch.call_args.args
+        assert url == '/action/ResetFilterTimeRemain'
+        assert body is None
 
-    @pytest.mark.asyncio
     async def test_executes_action_with_value(self, coordinator, mock_duco_client, mock_hass):
         await coordinator.async_execute_action('SetIdentify', True)
 
-        call_args = mock_duco_client.raw_patch.call_args
-        import json
-        body = json.loads(call_args[0][1])
-        assert body['Val'] is True
+        _, body = mock_duco_client.raw_patch.call_args.args
+        assert json.loads(body)['Val'] is True
 
-    @pytest.mark.asyncio
     async def test_raises_on_failure(self, coordinator, mock_duco_client, mock_hass):
         mock_duco_client.raw_patch.side_effect = Exception("timeout")
 
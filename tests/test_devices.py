@@ -14,7 +14,9 @@ from custom_components.ducobox_connectivity_board.model.devices import (
     DucoboxNodeSensorEntityDescription,
     NodeSensorMeta,
     NODE_SENSOR_REGISTRY,
+    NODE_SENSOR_REGISTRY_FLAT,
     SENSORS,
+    SENSORS_BY_KEY,
     discover_node_sensors,
     _humanize_key,
     _make_value_fn_processed,
@@ -22,6 +24,22 @@ from custom_components.ducobox_connectivity_board.model.devices import (
 )
 
 
+EMPTY_DATA = {'info': {}}
+
+# Float expectations used below, each wrapped in pytest.approx once.
+APPROX = {v: pytest.approx(v) for v in (
+    0.8, 1.6, 8.2, 8.9, 9.6, 10.8, 12.0, 15.8, 16.7, 18.6,
+    19.1, 19.5, 19.7, 19.8, 20.3, 20.4, 22.0, 23.8, 24.4,
+)}
+
+_EXPECTED_SENSOR_KEYS = frozenset({'Temp', 'Rh', 'IaqRh', 'Co2', 'IaqCo2'})
+_EXPECTED_VENTILATION_KEYS = frozenset({
+    'State', 'Mode', 'FlowLvlTgt', 'TimeStateRemain',
+    'TimeStateEnd', 'Pos', 'FlowLvlOvrl', 'FlowLvlReqSensor',
+})
+_EXPECTED_NETWORK_KEYS = frozenset({'CommErrorCtr', 'RssiRfN2M', 'RssiRfN2H', 'HopRf'})
+
+
 # ── _humanize_key ─────────────────────────────────────────────────────
 
 class TestHumanizeKey:
@@ -107,25 +125,28 @@ class TestNodeSensorRegistry:
         assert 'General' in NODE_SENSOR_REGISTRY
 
     def test_sensor_keys(self):
-        sensor_keys = set(NODE_SENSOR_REGISTRY['Sensor'].keys())
-        assert sensor_keys == {'Temp', 'Rh', 'IaqRh', 'Co2', 'IaqCo2'}
+        assert NODE_SENSOR_REGISTRY['Sensor'].keys() == _EXPECTED_SENSOR_KEYS
 
     def test_ventilation_keys(self):
-        vent_keys = set(NODE_SENSOR_REGISTRY['Ventilation'].keys())
-        expected = {
-            'State', 'Mode', 'FlowLvlTgt', 'TimeStateRemain',
-            'TimeStateEnd', 'Pos', 'FlowLvlOvrl', 'FlowLvlReqSensor',
-        }
-        assert vent_keys == expected
+        assert NODE_SENSOR_REGISTRY['Ventilation'].keys() == _EXPECTED_VENTILATION_KEYS
 
     def test_network_keys(self):
-        net_keys = set(NODE_SENSOR_REGISTRY['NetworkDuco'].keys())
-        assert net_keys == {'CommErrorCtr', 'RssiRfN2M', 'RssiRfN2H', 'HopRf'}
+        assert NODE_SENSOR_REGISTRY['NetworkDuco'].keys() == _EXPECTED_NETWORK_KEYS
 
     def test_all_entries_are_node_sensor_meta(self):
-        for module, keys in NODE_SENSOR_REGISTRY.items():
-            for key, meta in keys.items():
-                assert isinstance(meta, NodeSensorMeta), f"{module}.{key} is not NodeSensorMeta"
+        bad = [k for k, m in NODE_SENSOR_REGISTRY_FLAT.items() if not isinstance(m, NodeSensorMeta)]
+        assert not bad, f"Not NodeSensorMeta: {bad}"
+
+    def test_flat_registry_mirrors_nested(self):
+        assert NODE_SENSOR_REGISTRY_FLAT == {
+            (module, key): meta
+            for module, metas in NODE_SENSOR_REGISTRY.items()
+            for key, meta in metas.items()
+        }
+
+    def test_flat_registry_is_read_only(self):
+        with pytest.raises(TypeError):
+            NODE_SENSOR_REGISTRY_FLAT[('Sensor', 'Temp')] = None
 
     def test_temp_has_correct_device_class(self):
         meta = NODE_SENSOR_REGISTRY['Sensor']['Temp']
@@ -147,109 +168,66 @@ class TestNodeSensorRegistry:
 
 class TestDiscoverNodeSensors:
 
-    def test_box_node(self, api_nodes_response):
-        """BOX node (id=1) has Sensor, Ventilation, and NetworkDuco modules."""
-        node = api_nodes_response[0]
-        assert node['General']['Type']['Val'] == 'BOX'
-
-        descriptions = discover_node_sensors(node)
-
-        # Collect all sensor keys
-        keys = {d.sensor_key for d in descriptions}
-
-        # Sensor module
-        assert 'Sensor_Temp' in keys
-        assert 'Sensor_Rh' in keys
-        assert 'Sensor_IaqRh' in keys
-
-        # Ventilation module
-        assert 'Ventilation_State' in keys
-        assert 'Ventilation_Mode' in keys
-        assert 'Ventilation_FlowLvlTgt' in keys
-
-        # NetworkDuco module
-        assert 'NetworkDuco_CommErrorCtr' in keys
-
-    def test_ucco2_node(self, api_nodes_response):
-        """UCCO2 node (id=3) has CO₂ sensor."""
-        node = api_nodes_response[2]
-        assert node['General']['Type']['Val'] == 'UCCO2'
-
-        descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
-
-        assert 'Sensor_Co2' in keys
-        assert 'Sensor_IaqCo2' in keys
-        assert 'Sensor_Temp' in keys
-
-    def test_bsrh_node(self, api_nodes_response):
-        """BSRH node (id=58) has Rh and IaqRh sensors — the original bug."""
-        node = api_nodes_response[4]
-        assert node['General']['Type']['Val'] == 'BSRH'
-
-        descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
-
-        assert 'Sensor_Temp' in keys
-        assert 'Sensor_Rh' in keys
-        assert 'Sensor_IaqRh' in keys
-
-    def test_ucbat_node_has_no_sensor_module(self, api_nodes_response):
-        """UCBAT node (id=2) has no Sensor module, only Ventilation and NetworkDuco."""
-        node = api_nodes_response[1]
-        assert node['General']['Type']['Val'] == 'UCBAT'
-
-        descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
-
-        # No Sensor module → no Sensor_* keys
-        assert not any(k.startswith('Sensor_') for k in keys)
-
-        # But Ventilation and NetworkDuco keys should exist
-        assert 'Ventilation_State' in keys
-        assert 'NetworkDuco_CommErrorCtr' in keys
-
-    def test_switch_node_minimal(self, api_nodes_response):
-        """SWITCH node (id=52) has only Ventilation and NetworkDuco."""
-        node = api_nodes_response[3]
-        assert node['General']['Type']['Val'] == 'SWITCH'
-
-        descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
-
-        assert not any(k.startswith('Sensor_') for k in keys)
-        assert 'Ventilation_State' in keys
-
-    def test_known_sensor_has_metadata(self, api_nodes_response):
+    @pytest.mark.parametrize(
+        "node_idx,node_type,must_have,forbidden_prefix",
+        [
+            # BOX node (id=1) has Sensor, Ventilation, and NetworkDuco modules.
+            (0, 'BOX', {
+                'Sensor_Temp', 'Sensor_Rh', 'Sensor_IaqRh',
+                'Ventilation_State', 'Ventilation_Mode', 'Ventilation_FlowLvlTgt',
+                'NetworkDuco_CommErrorCtr',
+            }, None),
+            # UCCO2 node (id=3) has CO₂ sensor.
+            (2, 'UCCO2', {'Sensor_Co2', 'Sensor_IaqCo2', 'Sensor_Temp'}, None),
+            # BSRH node (id=58) has Rh and IaqRh sensors — the original bug.
+            (4, 'BSRH', {'Sensor_Temp', 'Sensor_Rh', 'Sensor_IaqRh'}, None),
+            # UCBAT node (id=2) has no Sensor module, only Ventilation and NetworkDuco.
+            (1, 'UCBAT', {'Ventilation_State', 'NetworkDuco_CommErrorCtr'}, 'Sensor_'),
+            # SWITCH node (id=52) has only Ventilation and NetworkDuco.
+            (3, 'SWITCH', {'Ventilation_State'}, 'Sensor_'),
+        ],
+    )
+    def test_node_sensor_keys(self, api_nodes_response, discovered,
+                              node_idx, node_type, must_have, forbidden_prefix):
+        node = api_nodes_response[node_idx]
+        assert node['General']['Type']['Val'] == node_type
+
+        keys = discovered(node).keys
+
+        assert must_have <= keys, f"missing: {must_have - keys}"
+        if forbidden_prefix is not None:
+            assert not any(k.startswith(forbidden_prefix) for k in keys)
+
+    def test_known_sensor_has_metadata(self, api_nodes_response, discovered):
         """Known sensor keys get rich metadata from the registry."""
         node = api_nodes_response[0]  # BOX
-        descriptions = discover_node_sensors(node)
+        by_key = discovered(node).by_key
 
-        temp_desc = next(d for d in descriptions if d.sensor_key == 'Sensor_Temp')
+        temp_desc = by_key['Sensor_Temp']
         assert temp_desc.name == 'Temperature'
         assert temp_desc.device_class is not None
         assert temp_desc.native_unit_of_measurement == '°C'
 
-    def test_value_fn_works_for_known_sensor(self, api_nodes_response):
+    def test_value_fn_works_for_known_sensor(self, api_nodes_response, discovered):
         """value_fn correctly extracts values from real node data."""
         node = api_nodes_response[0]  # BOX: Sensor.Temp.Val = 19.7
-        descriptions = discover_node_sensors(node)
+        by_key = discovered(node).by_key
 
-        temp_desc = next(d for d in descriptions if d.sensor_key == 'Sensor_Temp')
-        assert temp_desc.value_fn(node) == pytest.approx(19.7)
+        temp_desc = by_key['Sensor_Temp']
+        assert temp_desc.value_fn(node) == APPROX[19.7]
 
-    def test_value_fn_works_for_co2(self, api_nodes_response):
+    def test_value_fn_works_for_co2(self, api_nodes_response, discovered):
         node = api_nodes_response[2]  # UCCO2: Sensor.Co2.Val = 1056
-        descriptions = discover_node_sensors(node)
+        by_key = discovered(node).by_key
 
-        co2_desc = next(d for d in descriptions if d.sensor_key == 'Sensor_Co2')
+        co2_desc = by_key['Sensor_Co2']
         assert co2_desc.value_fn(node) == 1056
 
-    def test_value_fn_works_for_ventilation_state(self, api_nodes_response):
+    def test_value_fn_works_for_ventilation_state(self, api_nodes_response, discovered):
         node = api_nodes_response[0]
-        descriptions = discover_node_sensors(node)
+        by_key = discovered(node).by_key
 
-        state_desc = next(d for d in descriptions if d.sensor_key == 'Ventilation_State')
+        state_desc = by_key['Ventilation_State']
         assert state_desc.value_fn(node) == 'AUTO'
 
     def test_auto_discovers_unknown_key(self):
@@ -263,13 +241,14 @@ class TestDiscoverNodeSensors:
             },
         }
         descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
+        by_key = {d.sensor_key: d for d in descriptions}
+        keys = by_key.keys()
 
         assert 'Sensor_Temp' in keys
         assert 'Sensor_NewSensor' in keys
 
         # The unknown key should have a humanized name
-        new_desc = next(d for d in descriptions if d.sensor_key == 'Sensor_NewSensor')
+        new_desc = by_key['Sensor_NewSensor']
         assert 'New Sensor' in new_desc.name
         assert new_desc.value_fn(node) == 123
 
@@ -283,8 +262,7 @@ class TestDiscoverNodeSensors:
                 'SpeedExtra': {'Val': 42},     # unknown
             },
         }
-        descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
+        keys = {d.sensor_key for d in discover_node_sensors(node)}
 
         assert 'Ventilation_SpeedExtra' in keys
 
@@ -299,8 +277,7 @@ class TestDiscoverNodeSensors:
                 'Other': 'raw_string',       # Not a Val dict
             },
         }
-        descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
+        keys = {d.sensor_key for d in discover_node_sensors(node)}
 
         assert 'Sensor_Temp' in keys
         assert 'Sensor_Errors' not in keys
@@ -317,29 +294,25 @@ class TestDiscoverNodeSensors:
         # General module is scanned but Type is in the skip list, so no sensors
         assert len(descriptions) == 0
 
-    def test_returns_list_of_correct_type(self, api_nodes_response):
+    def test_returns_list_of_correct_type(self, api_nodes_response, discovered):
         node = api_nodes_response[0]
-        descriptions = discover_node_sensors(node)
+        descriptions = discovered(node).descriptions
         assert isinstance(descriptions, list)
         for d in descriptions:
             assert isinstance(d, DucoboxNodeSensorEntityDescription)
 
-    def test_descriptions_are_frozen(self, api_nodes_response):
+    def test_descriptions_are_frozen(self):
         """Descriptions are frozen dataclasses — immutable."""
-        node = api_nodes_response[0]
-        descriptions = discover_node_sensors(node)
-        desc = descriptions[0]
-        with pytest.raises(AttributeError):
-            desc.name = "tampered"
+        assert DucoboxNodeSensorEntityDescription.__dataclass_params__.frozen
 
-    def test_data_path_set_correctly(self, api_nodes_response):
+    def test_data_path_set_correctly(self, api_nodes_response, discovered):
         node = api_nodes_response[0]
-        descriptions = discover_node_sensors(node)
+        by_key = discovered(node).by_key
 
-        temp = next(d for d in descriptions if d.sensor_key == 'Sensor_Temp')
+        temp = by_key['Sensor_Temp']
         assert temp.data_path == ('Sensor', 'Temp')
 
-        state = next(d for d in descriptions if d.sensor_key == 'Ventilation_State')
+        state = by_key['Ventilation_State']
         assert state.data_path == ('Ventilation', 'State')
 
 
@@ -361,177 +334,61 @@ class TestBoxSensorsValueFn:
         for s in SENSORS:
             assert s.data_path is not None, f"Sensor {s.key} has no data_path"
 
-    def test_temp_oda(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'TempOda')
-        assert s.value_fn(coordinator_data) == pytest.approx(10.8)
-
-    def test_temp_sup(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'TempSup')
-        assert s.value_fn(coordinator_data) == pytest.approx(19.8)
-
-    def test_temp_eta(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'TempEta')
-        assert s.value_fn(coordinator_data) == pytest.approx(19.5)
-
-    def test_temp_eha(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'TempEha')
-        assert s.value_fn(coordinator_data) == pytest.approx(15.8)
-
-    def test_speed_sup(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'SpeedSup')
-        assert s.value_fn(coordinator_data) == 688
-
-    def test_speed_eha(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'SpeedEha')
-        assert s.value_fn(coordinator_data) == 857
-
-    def test_press_sup(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'PressSup')
-        assert s.value_fn(coordinator_data) == pytest.approx(8.9)
-
-    def test_press_eha(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'PressEha')
-        assert s.value_fn(coordinator_data) == pytest.approx(16.7)
-
-    def test_pwm_sup(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'PwmSup')
-        assert s.value_fn(coordinator_data) == 18
-
-    def test_pwm_eha(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'PwmEha')
-        assert s.value_fn(coordinator_data) == 25
-
-    def test_press_sup_tgt(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'PressSupTgt')
-        assert s.value_fn(coordinator_data) == pytest.approx(0.8)
-
-    def test_press_eha_tgt(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'PressEhaTgt')
-        assert s.value_fn(coordinator_data) == pytest.approx(1.6)
-
-    def test_rssi_wifi(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'RssiWifi')
-        assert s.value_fn(coordinator_data) == -56
-
-    def test_uptime(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'UpTime')
-        assert s.value_fn(coordinator_data) == 10936
-
-    def test_time_filter_remain(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'TimeFilterRemain')
-        assert s.value_fn(coordinator_data) == 145
-
-    def test_bypass_pos(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'BypassPos')
-        assert s.value_fn(coordinator_data) == 0
-
-    def test_bypass_temp_sup_tgt(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'BypassTempSupTgt')
-        assert s.value_fn(coordinator_data) == pytest.approx(23.8)
-
-    def test_frost_protect_state(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'FrostProtectState')
-        assert s.value_fn(coordinator_data) == 0
-
-    def test_night_boost_temp_outside(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'NightBoostTempOutsideAvg')
-        assert s.value_fn(coordinator_data) == pytest.approx(8.2)
-
-    def test_ventcool_state(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'VentCoolState')
-        assert s.value_fn(coordinator_data) == 0
-
-    def test_ventcool_temp_inside(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'VentCoolTempInside')
-        assert s.value_fn(coordinator_data) == pytest.approx(19.1)
-
-    def test_diag_status(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'DiagStatus')
-        assert s.value_fn(coordinator_data) == 'Ok'
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            ('TempOda', APPROX[10.8]),
+            ('TempSup', APPROX[19.8]),
+            ('TempEta', APPROX[19.5]),
+            ('TempEha', APPROX[15.8]),
+            ('SpeedSup', 688),
+            ('SpeedEha', 857),
+            ('PressSup', APPROX[8.9]),
+            ('PressEha', APPROX[16.7]),
+            ('PwmSup', 18),
+            ('PwmEha', 25),
+            ('PressSupTgt', APPROX[0.8]),
+            ('PressEhaTgt', APPROX[1.6]),
+            ('RssiWifi', -56),
+            ('UpTime', 10936),
+            ('TimeFilterRemain', 145),
+            ('BypassPos', 0),
+            ('BypassTempSupTgt', APPROX[23.8]),
+            ('FrostProtectState', 0),
+            ('NightBoostTempOutsideAvg', APPROX[8.2]),
+            ('VentCoolState', 0),
+            ('VentCoolTempInside', APPROX[19.1]),
+            ('DiagStatus', 'Ok'),
+            ('NightBoostTempOutsideAvgThs', APPROX[12.0]),
+            ('NightBoostTempOutside', APPROX[9.6]),
+            ('NightBoostTempComfort', APPROX[20.3]),
+            ('NightBoostTempZone1', APPROX[18.6]),
+            ('VentCoolTempOutsideAvgThs', APPROX[12.0]),
+            ('VentCoolTempOutsideAvg', APPROX[8.2]),
+            ('VentCoolTempInsideMin', APPROX[20.4]),
+            ('VentCoolTempInsideMax', APPROX[24.4]),
+            ('VentCoolTempComfort', APPROX[22.0]),
+            ('VentCoolTempOutside', APPROX[9.6]),
+            ('PwmLvlSup', 8000),
+            ('PwmLvlEha', 10192),
+            ('CalibrationState', 'IDLE'),
+            ('CalibrationStatus', 'NOT_APPLICABLE'),
+            ('LanMode', 'WIFI_CLIENT'),
+            ('LanIp', '192.168.0.100'),
+            ('NetworkDucoState', 'OPERATIONAL'),
+            ('PublicApiWriteReqCntRemain', 200),
+        ],
+    )
+    def test_value(self, coordinator_data, key, expected):
+        assert SENSORS_BY_KEY[key].value_fn(coordinator_data) == expected
 
     def test_sensor_returns_none_when_data_missing(self):
         """value_fn should return None when the data path doesn't exist."""
-        empty_data = {'info': {}}
-        for s in SENSORS:
-            result = s.value_fn(empty_data)
-            assert result is None, f"Sensor {s.key} returned {result} for empty data"
-
-    # -- New sensors added in expansion --
-
-    def test_nightboost_temp_outside_avg_ths(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'NightBoostTempOutsideAvgThs')
-        assert s.value_fn(coordinator_data) == pytest.approx(12.0)
-
-    def test_nightboost_temp_outside(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'NightBoostTempOutside')
-        assert s.value_fn(coordinator_data) == pytest.approx(9.6)
-
-    def test_nightboost_temp_comfort(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'NightBoostTempComfort')
-        assert s.value_fn(coordinator_data) == pytest.approx(20.3)
-
-    def test_nightboost_temp_zone1(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'NightBoostTempZone1')
-        assert s.value_fn(coordinator_data) == pytest.approx(18.6)
-
-    def test_ventcool_temp_outside_avg_ths(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'VentCoolTempOutsideAvgThs')
-        assert s.value_fn(coordinator_data) == pytest.approx(12.0)
-
-    def test_ventcool_temp_outside_avg(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'VentCoolTempOutsideAvg')
-        assert s.value_fn(coordinator_data) == pytest.approx(8.2)
-
-    def test_ventcool_temp_inside_min(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'VentCoolTempInsideMin')
-        assert s.value_fn(coordinator_data) == pytest.approx(20.4)
-
-    def test_ventcool_temp_inside_max(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'VentCoolTempInsideMax')
-        assert s.value_fn(coordinator_data) == pytest.approx(24.4)
-
-    def test_ventcool_temp_comfort(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'VentCoolTempComfort')
-        assert s.value_fn(coordinator_data) == pytest.approx(22.0)
-
-    def test_ventcool_temp_outside(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'VentCoolTempOutside')
-        assert s.value_fn(coordinator_data) == pytest.approx(9.6)
-
-    def test_pwm_lvl_sup(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'PwmLvlSup')
-        assert s.value_fn(coordinator_data) == 8000
-
-    def test_pwm_lvl_eha(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'PwmLvlEha')
-        assert s.value_fn(coordinator_data) == 10192
-
-    def test_calibration_state(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'CalibrationState')
-        assert s.value_fn(coordinator_data) == 'IDLE'
-
-    def test_calibration_status(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'CalibrationStatus')
-        assert s.value_fn(coordinator_data) == 'NOT_APPLICABLE'
-
-    def test_lan_mode(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'LanMode')
-        assert s.value_fn(coordinator_data) == 'WIFI_CLIENT'
-
-    def test_lan_ip(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'LanIp')
-        assert s.value_fn(coordinator_data) == '192.168.0.100'
-
-    def test_network_duco_state(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'NetworkDucoState')
-        assert s.value_fn(coordinator_data) == 'OPERATIONAL'
-
-    def test_public_api_write_req(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'PublicApiWriteReqCntRemain')
-        assert s.value_fn(coordinator_data) == 200
+        bad = [s.key for s in SENSORS if s.value_fn(EMPTY_DATA) is not None]
+        assert not bad, f"Non-None from empty data: {bad}"
 
     def test_heater_oda_present(self, coordinator_data):
-        s = next(s for s in SENSORS if s.key == 'HeaterOdaPresent')
+        s = SENSORS_BY_KEY['HeaterOdaPresent']
         assert s.value_fn(coordinator_data) is False
 
 
@@ -548,8 +405,7 @@ class TestGeneralModuleDiscovery:
                 'Name': {'Val': 'Test'},
             },
         }
-        descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
+        keys = {d.sensor_key for d in discover_node_sensors(node)}
         assert 'General_UpTime' in keys
 
     def test_skips_type_in_general(self):
@@ -559,8 +415,7 @@ class TestGeneralModuleDiscovery:
                 'Type': {'Val': 'BOX'},
             },
         }
-        descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
+        keys = {d.sensor_key for d in discover_node_sensors(node)}
         assert 'General_Type' not in keys
 
     def test_skips_name_in_general(self):
@@ -571,8 +426,7 @@ class TestGeneralModuleDiscovery:
                 'Name': {'Val': 'test'},
             },
         }
-        descriptions = discover_node_sensors(node)
-        keys = {d.sensor_key for d in descriptions}
+        keys = {d.sensor_key for d in discover_node_sensors(node)}
         assert 'General_Name' not in keys
 
     def test_uptime_has_duration_device_class(self):
@@ -583,7 +437,6 @@ class TestGeneralModuleDiscovery:
                 'UpTime': {'Val': 500},
             },
         }
-        descriptions = discover_node_sensors(node)
-        uptime = next(d for d in descriptions if d.sensor_key == 'General_UpTime')
+        uptime = next(d for d in discover_node_sensors(node) if d.sensor_key == 'General_UpTime')
         assert uptime.device_class is not None
         assert uptime.device_class.value == 'duration'
@@ -1,7 +1,7 @@
 """Tests for number.py — number platform entities."""
 
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 
 from custom_components.ducobox_connectivity_board.number import (
     async_setup_entry,
@@ -11,35 +11,73 @@ from custom_components.ducobox_connectivity_board.number import (
     _humanize_config_key,
 )
 from custom_components.ducobox_connectivity_board.const import DOMAIN
+from tests.helpers import assert_all_unique, collect_entities
+from tests.stubs import StubCoordinator
 
 
-@pytest.fixture
+_ENTRY_ID = 'test_entry_123'
+_TEMP_UID = 'aabbccddeeff-config-HeatRecovery-Bypass-TempSupTgtZone1'
+_FILTER_UID = 'aabbccddeeff-config-HeatRecovery-Bypass-TimeFilter'
+
+
+def _make_hass(coordinator):
+    hass = MagicMock()
+    hass.data = {DOMAIN: {_ENTRY_ID: {'coordinator': coordinator}}}
+    return hass, _ENTRY_ID
+
+
+@pytest.fixture(scope="module")
 def mock_coordinator(coordinator_data):
-    coord = MagicMock()
-    coord.data = coordinator_data
-    coord.last_update_success = True
-    coord.async_set_value = AsyncMock()
-    coord.async_set_box_config = AsyncMock()
-    coord.async_request_refresh = AsyncMock()
-    return coord
+    """Coordinator shared by the module; its data must not be modified."""
+    return StubCoordinator(coordinator_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_hass(mock_coordinator):
-    hass = MagicMock()
-    entry_id = 'test_entry_123'
-    hass.data = {DOMAIN: {entry_id: {'coordinator': mock_coordinator}}}
-    return hass, entry_id
+    return _make_hass(mock_coordinator)
 
 
-@pytest.fixture
-def mock_entry(mock_hass):
-    hass, entry_id = mock_hass
+@pytest.fixture(scope="module")
+def mock_entry():
     entry = MagicMock()
-    entry.entry_id = entry_id
+    entry.entry_id = _ENTRY_ID
     return entry
 
 
+@pytest.fixture(scope="module")
+async def setup_entities(mock_hass, mock_entry):
+    """Entities from a single async_setup_entry run, shared by the module."""
+    hass, _ = mock_hass
+    return await collect_entities(async_setup_entry, hass, mock_entry)
+
+
+@pytest.fixture(scope="module")
+def by_uid(setup_entities):
+    return {e._attr_unique_id: e for e in setup_entities}
+
+
+@pytest.fixture(scope="module")
+def box_uids(setup_entities):
+    return {e._attr_unique_id for e in setup_entities if isinstance(e, DucoboxBoxNumberEntity)}
+
+
+@pytest.fixture(scope="module")
+def box_uids_blob(box_uids):
+    """box_uids joined into one string for substring checks."""
+    return '\n'.join(box_uids)
+
+
+@pytest.fixture(scope="module")
+def node_uids(setup_entities):
+    return {e._attr_unique_id for e in setup_entities if isinstance(e, DucoboxNodeNumberEntity)}
+
+
+@pytest.fixture
+def fresh_coordinator(coordinator_data):
+    """Per-test coordinator with an empty call log, for tests that assert on calls."""
+    return StubCoordinator(coordinator_data)
+
+
 class TestIsNumberParam:
 
     def test_valid(self):
@@ -69,207 +107,94 @@ class TestHumanizeConfigKey:
 
 class TestNumberSetupEntry:
 
-    @pytest.mark.asyncio
-    async def test_creates_node_number_entities(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        node_entities = [e for e in added_entities if isinstance(e, DucoboxNodeNumberEntity)]
-        assert len(node_entities) > 0
-
-    @pytest.mark.asyncio
-    async def test_creates_box_number_entities(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        box_entities = [e for e in added_entities if isinstance(e, DucoboxBoxNumberEntity)]
-        assert len(box_entities) > 0
-
-    @pytest.mark.asyncio
-    async def test_unique_ids_unique(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    def test_creates_node_number_entities(self, node_uids):
+        assert len(node_uids) > 0
 
-        unique_ids = [e._attr_unique_id for e in added_entities]
-        assert len(unique_ids) == len(set(unique_ids))
+    def test_creates_box_number_entities(self, box_uids):
+        assert len(box_uids) > 0
 
-    @pytest.mark.asyncio
-    async def test_skips_on_unknown_mac(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        mock_coordinator.data['info']['General']['Lan']['Mac'] = {'Val': None}
-        added_entities = []
+    def test_unique_ids_unique(self, setup_entities):
+        assert_all_unique(e._attr_unique_id for e in setup_entities)
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    async def test_skips_on_unknown_mac(self, coordinator_data_no_mac, mock_entry):
+        hass, _ = _make_hass(StubCoordinator(coordinator_data_no_mac))
+        added_entities = await collect_entities(async_setup_entry, hass, mock_entry)
 
         assert len(added_entities) == 0
 
-    @pytest.mark.asyncio
-    async def test_skips_excluded_submodules(self, mock_hass, mock_entry, mock_coordinator):
+    @pytest.mark.parametrize('needle', [
+        'General-Setup', 'General-Modbus', 'General-AutoRebootComm',
+        'General-PublicApi', 'Firmware-General', 'Azure-Connection',
+    ])
+    def test_skips_excluded_submodules(self, box_uids_blob, needle):
         """Entire submodules in the skip set should be excluded."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        box_ids = {e._attr_unique_id for e in added_entities if isinstance(e, DucoboxBoxNumberEntity)}
-        # These submodules are fully excluded
-        assert not any('General-Setup' in uid for uid in box_ids)
-        assert not any('General-Modbus' in uid for uid in box_ids)
-        assert not any('General-AutoRebootComm' in uid for uid in box_ids)
-        assert not any('General-PublicApi' in uid for uid in box_ids)
-        assert not any('Firmware-General' in uid for uid in box_ids)
-        assert not any('Azure-Connection' in uid for uid in box_ids)
-
-    @pytest.mark.asyncio
-    async def test_skips_excluded_individual_keys(self, mock_hass, mock_entry, mock_coordinator):
-        """Individual keys in the key-level skip set should be excluded."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+        assert needle not in box_uids_blob
 
-        box_ids = {e._attr_unique_id for e in added_entities if isinstance(e, DucoboxBoxNumberEntity)}
-        assert not any('TimeDucoClientIp' in uid for uid in box_ids)
-        assert not any('General-Lan-Mode' in uid for uid in box_ids)
-        assert not any('General-Lan-Dhcp' in uid for uid in box_ids)
+    @pytest.mark.parametrize('needle', ['TimeDucoClientIp', 'General-Lan-Mode', 'General-Lan-Dhcp'])
+    def test_skips_excluded_individual_keys(self, box_uids_blob, needle):
+        """Individual keys in the key-level skip set should be excluded."""
+        assert needle not in box_uids_blob
 
-    @pytest.mark.asyncio
-    async def test_skips_fixed_min_equals_max(self, mock_hass, mock_entry, mock_coordinator):
+    # Setup.Complete has Min==Max==1, should be skipped even if submodule wasn't excluded
+    @pytest.mark.parametrize('needle', ['Complete', 'Country'])
+    def test_skips_fixed_min_equals_max(self, box_uids_blob, needle):
         """Parameters where Min == Max are not user-configurable and should be excluded."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        box_ids = {e._attr_unique_id for e in added_entities if isinstance(e, DucoboxBoxNumberEntity)}
-        # Setup.Complete has Min==Max==1, should be skipped even if submodule wasn't excluded
-        assert not any('Complete' in uid for uid in box_ids)
-        assert not any('Country' in uid for uid in box_ids)
+        assert needle not in box_uids_blob
 
-    @pytest.mark.asyncio
-    async def test_includes_useful_params(self, mock_hass, mock_entry, mock_coordinator):
+    @pytest.mark.parametrize('needle', ['TimeFilter', 'TempStart', 'SpeedWindMax', 'TempSupTgtZone1'])
+    def test_includes_useful_params(self, box_uids_blob, needle):
         """Useful parameters should still be created."""
-        hass, _ = mock_hass
-        added_entities = []
+        assert needle in box_uids_blob
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        box_ids = {e._attr_unique_id for e in added_entities if isinstance(e, DucoboxBoxNumberEntity)}
-        assert any('TimeFilter' in uid for uid in box_ids)
-        assert any('TempStart' in uid for uid in box_ids)
-        assert any('SpeedWindMax' in uid for uid in box_ids)
-        assert any('TempSupTgtZone1' in uid for uid in box_ids)
-
-    @pytest.mark.asyncio
-    async def test_skips_boolean_params(self, mock_hass, mock_entry, mock_coordinator):
+    @pytest.mark.parametrize('needle', ['EnableMonday', 'TempDepEnable', 'Adaptive'])
+    def test_skips_boolean_params(self, box_uids_blob, needle):
         """Boolean params (Min=0, Max=1) belong in switch platform, not number."""
-        hass, _ = mock_hass
-        added_entities = []
+        assert needle not in box_uids_blob
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    def test_skips_nightboost_enable(self, box_uids):
+        assert not any('NightBoost' in uid and 'Enable' in uid for uid in box_uids)
 
-        box_ids = {e._attr_unique_id for e in added_entities if isinstance(e, DucoboxBoxNumberEntity)}
-        assert not any('EnableMonday' in uid for uid in box_ids)
-        assert not any('TempDepEnable' in uid for uid in box_ids)
-        assert not any('Adaptive' in uid for uid in box_ids)
-        assert not any('NightBoost' in uid and 'Enable' in uid for uid in box_ids)
-
-    @pytest.mark.asyncio
-    async def test_skips_enum_select_params(self, mock_hass, mock_entry, mock_coordinator):
+    # Bypass.Mode and VentCool.General.Mode should be selects, not numbers
+    @pytest.mark.parametrize('needle', ['Bypass-Mode', 'VentCool-General-Mode'])
+    def test_skips_enum_select_params(self, box_uids_blob, needle):
         """Enum-like params in _CONFIG_SELECT_PARAMS belong in select platform."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        box_ids = {e._attr_unique_id for e in added_entities if isinstance(e, DucoboxBoxNumberEntity)}
-        # Bypass.Mode and VentCool.General.Mode should be selects, not numbers
-        assert not any('Bypass-Mode' in uid for uid in box_ids)
-        assert not any('VentCool-General-Mode' in uid for uid in box_ids)
+        assert needle not in box_uids_blob
 
 
 class TestTemperatureScaling:
     """Temperature parameters stored in tenths should display as °C."""
 
-    @pytest.mark.asyncio
-    async def test_temp_entity_has_celsius_unit(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        temp_entity = next(
-            e for e in added_entities
-            if isinstance(e, DucoboxBoxNumberEntity) and 'TempSupTgtZone1' in e._attr_unique_id
-        )
+    def test_temp_entity_has_celsius_unit(self, by_uid):
+        temp_entity = by_uid[_TEMP_UID]
         assert temp_entity._attr_native_unit_of_measurement == '°C'
 
-    @pytest.mark.asyncio
-    async def test_temp_entity_range_scaled(self, mock_hass, mock_entry, mock_coordinator):
+    def test_temp_entity_range_scaled(self, by_uid):
         """Min/Max/Step should be divided by 10 for tenths-of-degree params."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        temp_entity = next(
-            e for e in added_entities
-            if isinstance(e, DucoboxBoxNumberEntity) and 'TempSupTgtZone1' in e._attr_unique_id
-        )
+        temp_entity = by_uid[_TEMP_UID]
         assert temp_entity._attr_native_min_value == 10.0
         assert temp_entity._attr_native_max_value == 25.5
         assert temp_entity._attr_native_step == 0.1
 
-    @pytest.mark.asyncio
-    async def test_temp_entity_native_value_scaled(self, mock_hass, mock_entry, mock_coordinator):
+    def test_temp_entity_native_value_scaled(self, by_uid):
         """native_value should be raw API value ÷ 10."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        temp_entity = next(
-            e for e in added_entities
-            if isinstance(e, DucoboxBoxNumberEntity) and 'TempSupTgtZone1' in e._attr_unique_id
-        )
+        temp_entity = by_uid[_TEMP_UID]
         # Raw API value is 210, should display as 21.0
         assert temp_entity.native_value == 21.0
 
-    @pytest.mark.asyncio
-    async def test_temp_entity_set_value_scales_back(self, mock_hass, mock_entry, mock_coordinator):
+    async def test_temp_entity_set_value_scales_back(self, fresh_coordinator, mock_entry):
         """Setting 21.5°C should send 215 to the API."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        temp_entity = next(
-            e for e in added_entities
-            if isinstance(e, DucoboxBoxNumberEntity) and 'TempSupTgtZone1' in e._attr_unique_id
-        )
+        hass, _ = _make_hass(fresh_coordinator)
+        entities = await collect_entities(async_setup_entry, hass, mock_entry)
+        temp_entity = next(e for e in entities if e._attr_unique_id == _TEMP_UID)
         await temp_entity.async_set_native_value(21.5)
-        mock_coordinator.async_set_box_config.assert_called_with(
-            'HeatRecovery', 'Bypass', 'TempSupTgtZone1', 215
-        )
+        assert fresh_coordinator.calls == [
+            ('async_set_box_config', ('HeatRecovery', 'Bypass', 'TempSupTgtZone1', 215), {}),
+            ('async_request_refresh', (), {}),
+        ]
 
-    @pytest.mark.asyncio
-    async def test_non_temp_entity_has_no_unit(self, mock_hass, mock_entry, mock_coordinator):
+    def test_non_temp_entity_has_no_unit(self, by_uid):
         """Non-temperature entities should have no unit."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        filter_entity = next(
-            e for e in added_entities
-            if isinstance(e, DucoboxBoxNumberEntity) and 'TimeFilter' in e._attr_unique_id
-        )
+        filter_entity = by_uid[_FILTER_UID]
         assert filter_entity._attr_native_unit_of_measurement is None
         # Non-scaled: raw value should pass through directly
         assert filter_entity.native_value == 180
@@ -277,11 +202,10 @@ class TestTemperatureScaling:
 
 class TestNodeNumberEntity:
 
-    @pytest.mark.asyncio
-    async def test_native_value_reads_from_coordinator(self, mock_coordinator):
-        """native_value reads from coordinator.data, not cached."""
-        entity = DucoboxNodeNumberEntity(
-            coordinator=mock_coordinator,
+    @pytest.fixture
+    def node_number_entity(self, fresh_coordinator):
+        return DucoboxNodeNumberEntity(
+            coordinator=fresh_coordinator,
             node_id=1,
             param_key='FlowLvlAutoMin',
             device_info={'name': 'test', 'identifiers': set()},
@@ -289,10 +213,11 @@ class TestNodeNumberEntity:
             min_value=10, max_value=80, step=5,
         )
 
-        assert entity.native_value == 30
+    def test_native_value_reads_from_coordinator(self, node_number_entity):
+        """native_value reads from coordinator.data, not cached."""
+        assert node_number_entity.native_value == 30
 
-    @pytest.mark.asyncio
-    async def test_native_value_returns_none_if_missing(self, mock_coordinator):
+    def test_native_value_returns_none_if_missing(self, mock_coordinator):
         entity = DucoboxNodeNumberEntity(
             coordinator=mock_coordinator,
             node_id=999,
@@ -303,28 +228,20 @@ class TestNodeNumberEntity:
         )
         assert entity.native_value is None
 
-    @pytest.mark.asyncio
-    async def test_set_value_calls_coordinator(self, mock_coordinator):
-        entity = DucoboxNodeNumberEntity(
-            coordinator=mock_coordinator,
-            node_id=3,
-            param_key='Co2SetPoint',
-            device_info={'name': 'test', 'identifiers': set()},
-            unique_id='test-3-Co2SetPoint',
-            min_value=0, max_value=2000, step=10,
-        )
-
-        await entity.async_set_native_value(1200)
-        mock_coordinator.async_set_value.assert_called_once_with(3, 'Co2SetPoint', 1200)
-        mock_coordinator.async_request_refresh.assert_called_once()
+    async def test_set_value_calls_coordinator(self, node_number_entity, fresh_coordinator):
+        await node_number_entity.async_set_native_value(40)
+        assert fresh_coordinator.calls == [
+            ('async_set_value', (1, 'FlowLvlAutoMin', 40), {}),
+            ('async_request_refresh', (), {}),
+        ]
 
 
 class TestBoxNumberEntity:
 
-    @pytest.mark.asyncio
-    async def test_native_value_reads_from_coordinator(self, mock_coordinator):
-        entity = DucoboxBoxNumberEntity(
-            coordinator=mock_coordinator,
+    @pytest.fixture
+    def box_number_entity(self, fresh_coordinator):
+        return DucoboxBoxNumberEntity(
+            coordinator=fresh_coordinator,
             module='HeatRecovery',
             submodule='Bypass',
             param_key='TimeFilter',
@@ -333,23 +250,13 @@ class TestBoxNumberEntity:
             name='HeatRecovery Bypass TimeFilter',
             min_value=90, max_value=360, step=1,
         )
-        assert entity.native_value == 180
 
-    @pytest.mark.asyncio
-    async def test_set_value_calls_coordinator(self, mock_coordinator):
-        entity = DucoboxBoxNumberEntity(
-            coordinator=mock_coordinator,
-            module='HeatRecovery',
-            submodule='Bypass',
-            param_key='TimeFilter',
-            device_info={'name': 'test', 'identifiers': set()},
-            unique_id='test-config-HeatRecovery-Bypass-TimeFilter',
-            name='HeatRecovery Bypass TimeFilter',
-            min_value=90, max_value=360, step=1,
-        )
+    def test_native_value_reads_from_coordinator(self, box_number_entity):
+        assert box_number_entity.native_value == 180
 
-        await entity.async_set_native_value(200)
-        mock_coordinator.async_set_box_config.assert_called_once_with(
-            'HeatRecovery', 'Bypass', 'TimeFilter', 200
-        )
-        mock_coordinator.async_request_refresh.assert_called_once()
+    async def test_set_value_calls_coordinator(self, box_number_entity, fresh_coordinator):
+        await box_number_entity.async_set_native_value(200)
+        assert fresh_coordinator.calls == [
+            ('async_set_box_config', ('HeatRecovery', 'Bypass', 'TimeFilter', 200), {}),
+            ('async_request_refresh', (), {}),
+        ]
@@ -1,7 +1,7 @@
 """Tests for select.py — select platform entities."""
 
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 
 from custom_components.ducobox_connectivity_board.select import (
     async_setup_entry,
@@ -10,35 +10,79 @@ from custom_components.ducobox_connectivity_board.select import (
     _humanize_action,
 )
 from custom_components.ducobox_connectivity_board.const import DOMAIN
+from tests.helpers import assert_all_unique, collect_entities
+from tests.stubs import StubCoordinator
 
 
-@pytest.fixture
+_ENTRY_ID = 'test_entry_123'
+_BYPASS_MODE_UID = 'aabbccddeeff-config-HeatRecovery-Bypass-Mode'
+
+
+def _make_hass(coordinator):
+    hass = MagicMock()
+    hass.data = {DOMAIN: {_ENTRY_ID: {'coordinator': coordinator}}}
+    return hass, _ENTRY_ID
+
+
+@pytest.fixture(scope="module")
 def mock_coordinator(coordinator_data):
-    coord = MagicMock()
-    coord.data = coordinator_data
-    coord.last_update_success = True
-    coord.async_set_ventilation_state = AsyncMock()
-    coord.async_set_box_config = AsyncMock()
-    coord.async_request_refresh = AsyncMock()
-    return coord
+    """Coordinator shared by the module; its data must not be modified."""
+    return StubCoordinator(coordinator_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_hass(mock_coordinator):
-    hass = MagicMock()
-    entry_id = 'test_entry_123'
-    hass.data = {DOMAIN: {entry_id: {'coordinator': mock_coordinator}}}
-    return hass, entry_id
+    return _make_hass(mock_coordinator)
 
 
-@pytest.fixture
-def mock_entry(mock_hass):
-    hass, entry_id = mock_hass
+@pytest.fixture(scope="module")
+def mock_entry():
     entry = MagicMock()
-    entry.entry_id = entry_id
+    entry.entry_id = _ENTRY_ID
     return entry
 
 
+@pytest.fixture(scope="module")
+async def select_entities(mock_hass, mock_entry):
+    """Entities from a single async_setup_entry run, shared by the module."""
+    hass, _ = mock_hass
+    return await collect_entities(async_setup_entry, hass, mock_entry)
+
+
+@pytest.fixture(scope="module")
+def by_uid(select_entities):
+    return {e._attr_unique_id: e for e in select_entities}
+
+
+@pytest.fixture(scope="module")
+def config_select_uids(select_entities):
+    return {e._attr_unique_id for e in select_entities if isinstance(e, DucoboxConfigSelectEntity)}
+
+
+@pytest.fixture
+def fresh_coordinator(coordinator_data):
+    """Per-test coordinator with an empty call log, for tests that assert on calls."""
+    return StubCoordinator(coordinator_data)
+
+
+@pytest.fixture
+async def fresh_select_entities(fresh_coordinator, mock_entry):
+    """Entities created over fresh_coordinator, for tests that act on them."""
+    hass, _ = _make_hass(fresh_coordinator)
+    return await collect_entities(async_setup_entry, hass, mock_entry)
+
+
+@pytest.fixture
+def mock_coordinator_mut(coordinator_data_mut):
+    """Per-test coordinator over a private copy of the data, for tests that modify it."""
+    return StubCoordinator(coordinator_data_mut)
+
+
+@pytest.fixture
+def mock_hass_mut(mock_coordinator_mut):
+    return _make_hass(mock_coordinator_mut)
+
+
 class TestHumanizeAction:
 
     def test_set_ventilation_state(self):
@@ -50,71 +94,38 @@ class TestHumanizeAction:
 
 class TestSelectSetupEntry:
 
-    @pytest.mark.asyncio
-    async def test_creates_select_entities(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        assert len(added_entities) > 0
-        for entity in added_entities:
+    def test_creates_select_entities(self, select_entities):
+        assert len(select_entities) > 0
+        for entity in select_entities:
             assert isinstance(entity, (DucoboxActionSelectEntity, DucoboxConfigSelectEntity))
 
-    @pytest.mark.asyncio
-    async def test_creates_one_per_node_with_enum(self, mock_hass, mock_entry, mock_coordinator):
+    def test_creates_one_per_node_with_enum(self, select_entities):
         """Each node with a SetVentilationState Enum action gets a select entity."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        action_entities = [e for e in added_entities if isinstance(e, DucoboxActionSelectEntity)]
+        action_entities = [e for e in select_entities if isinstance(e, DucoboxActionSelectEntity)]
         # Fixture has 2 nodes with SetVentilationState
         assert len(action_entities) == 2
 
-    @pytest.mark.asyncio
-    async def test_unique_ids(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    def test_unique_ids(self, select_entities):
+        assert_all_unique(e._attr_unique_id for e in select_entities)
 
-        unique_ids = [e._attr_unique_id for e in added_entities]
-        assert len(unique_ids) == len(set(unique_ids))
-
-    @pytest.mark.asyncio
-    async def test_current_option_from_coordinator(self, mock_hass, mock_entry, mock_coordinator):
+    def test_current_option_from_coordinator(self, select_entities):
         """current_option reads from coordinator.data nodes."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
         # Node 1 has Ventilation.State.Val = 'AUTO'
-        node1_entity = next(e for e in added_entities if e._node_id == 1)
+        node1_entity = next(e for e in select_entities if e._node_id == 1)
         assert node1_entity.current_option == 'AUTO'
 
-    @pytest.mark.asyncio
-    async def test_select_option_calls_coordinator(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        entity = added_entities[0]
+    async def test_select_option_calls_coordinator(self, fresh_select_entities, fresh_coordinator):
+        entity = fresh_select_entities[0]
         await entity.async_select_option('MAN1')
 
-        mock_coordinator.async_set_ventilation_state.assert_called_once()
-        mock_coordinator.async_request_refresh.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_no_action_entities_when_no_action_nodes(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        mock_coordinator.data['action_nodes'] = {'Nodes': []}
-        added_entities = []
+        assert [name for name, _, _ in fresh_coordinator.calls] == [
+            'async_set_ventilation_state', 'async_request_refresh',
+        ]
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    async def test_no_action_entities_when_no_action_nodes(self, mock_hass_mut, mock_entry, mock_coordinator_mut):
+        hass, _ = mock_hass_mut
+        mock_coordinator_mut.data['action_nodes'] = {'Nodes': []}
+        added_entities = await collect_entities(async_setup_entry, hass, mock_entry)
 
         action_entities = [e for e in added_entities if isinstance(e, DucoboxActionSelectEntity)]
         assert len(action_entities) == 0
@@ -125,58 +136,24 @@ class TestSelectSetupEntry:
 
 class TestConfigSelectEntity:
 
-    @pytest.mark.asyncio
-    async def test_creates_config_selects(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        config_entities = [e for e in added_entities if isinstance(e, DucoboxConfigSelectEntity)]
-        uids = {e._attr_unique_id for e in config_entities}
-        assert any('Bypass-Mode' in uid for uid in uids)
-        assert any('VentCool' in uid and 'Mode' in uid for uid in uids)
-
-    @pytest.mark.asyncio
-    async def test_bypass_mode_options(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    def test_creates_config_selects(self, config_select_uids):
+        assert any('Bypass-Mode' in uid for uid in config_select_uids)
+        assert any('VentCool' in uid and 'Mode' in uid for uid in config_select_uids)
 
-        bypass_mode = next(
-            e for e in added_entities
-            if isinstance(e, DucoboxConfigSelectEntity) and 'Bypass-Mode' in e._attr_unique_id
-        )
+    def test_bypass_mode_options(self, by_uid):
+        bypass_mode = by_uid[_BYPASS_MODE_UID]
         assert bypass_mode.options == ['Auto', 'Closed', 'Open']
 
-    @pytest.mark.asyncio
-    async def test_current_option(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
+    def test_current_option(self, by_uid):
         # HeatRecovery.Bypass.Mode Val=0 → 'Auto'
-        bypass_mode = next(
-            e for e in added_entities
-            if isinstance(e, DucoboxConfigSelectEntity) and 'Bypass-Mode' in e._attr_unique_id
-        )
+        bypass_mode = by_uid[_BYPASS_MODE_UID]
         assert bypass_mode.current_option == 'Auto'
 
-    @pytest.mark.asyncio
-    async def test_select_option_sends_api_value(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        bypass_mode = next(
-            e for e in added_entities
-            if isinstance(e, DucoboxConfigSelectEntity) and 'Bypass-Mode' in e._attr_unique_id
-        )
+    async def test_select_option_sends_api_value(self, fresh_select_entities, fresh_coordinator):
+        bypass_mode = next(e for e in fresh_select_entities if e._attr_unique_id == _BYPASS_MODE_UID)
         await bypass_mode.async_select_option('Open')
 
-        mock_coordinator.async_set_box_config.assert_called_with(
-            'HeatRecovery', 'Bypass', 'Mode', 2
-        )
+        assert fresh_coordinator.calls == [
+            ('async_set_box_config', ('HeatRecovery', 'Bypass', 'Mode', 2), {}),
+            ('async_request_refresh', (), {}),
+        ]
@@ -4,8 +4,10 @@ We test async_setup_entry by mocking the coordinator and verifying that
 the correct entities are created for both box-level and node-level sensors.
 """
 
+from collections import defaultdict
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock, AsyncMock
 
 from custom_components.ducobox_connectivity_board.sensor import async_setup_entry
 from custom_components.ducobox_connectivity_board.model.coordinator import (
@@ -14,105 +16,79 @@ from custom_components.ducobox_connectivity_board.model.coordinator import (
 )
 from custom_components.ducobox_connectivity_board.model.devices import SENSORS
 from custom_components.ducobox_connectivity_board.const import DOMAIN
+from tests.helpers import assert_all_unique, collect_entities
+from tests.stubs import StubCoordinator
 
 
-@pytest.fixture
-def mock_coordinator(coordinator_data):
-    """A coordinator-like object with realistic data."""
-    coord = MagicMock()
-    coord.data = coordinator_data
-    coord.last_update_success = True
-    return coord
+_ENTRY_ID = 'test_entry_123'
 
 
-@pytest.fixture
-def mock_hass(mock_coordinator):
-    """Mock hass with coordinator in data."""
-    hass = MagicMock()
-    entry_id = 'test_entry_123'
-    hass.data = {DOMAIN: {entry_id: {'coordinator': mock_coordinator}}}
-    return hass, entry_id
+def _make_hass(coordinator):
+    """Stub hass with coordinator in data."""
+    hass = SimpleNamespace(data={DOMAIN: {_ENTRY_ID: {'coordinator': coordinator}}})
+    return hass, _ENTRY_ID
 
 
-@pytest.fixture
-def mock_entry(mock_hass):
-    """Mock ConfigEntry."""
-    hass, entry_id = mock_hass
-    entry = MagicMock()
-    entry.entry_id = entry_id
-    return entry
+async def _setup(data, entry):
+    """Run async_setup_entry over ``data`` and return the added entities."""
+    hass, _ = _make_hass(StubCoordinator(data))
+    return await collect_entities(async_setup_entry, hass, entry)
 
 
-# ── async_setup_entry ─────────────────────────────────────────────────
+@pytest.fixture(scope="module")
+def mock_entry():
+    """Stub ConfigEntry."""
+    return SimpleNamespace(entry_id=_ENTRY_ID)
 
-class TestAsyncSetupEntry:
 
-    @pytest.mark.asyncio
-    async def test_creates_entities(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
+@pytest.fixture(scope="module")
+async def setup_result(coordinator_data, mock_entry):
+    """Entities from a single async_setup_entry run over the shared data.
 
-        def capture_entities(entities):
-            added_entities.extend(entities)
+    Also carries the box/node splits and key indexes the tests check.
+    """
+    entities = await _setup(coordinator_data, mock_entry)
 
-        await async_setup_entry(hass, mock_entry, capture_entities)
+    box = [e for e in entities if isinstance(e, DucoboxSensorEntity)]
+    node = [e for e in entities if isinstance(e, DucoboxNodeSensorEntity)]
+    node_by_id = defaultdict(set)
+    for e in node:
+        node_by_id[e._node_id].add(e.entity_description.sensor_key)
 
-        assert len(added_entities) > 0
+    return SimpleNamespace(
+        all=entities,
+        box=box,
+        node=node,
+        box_keys={e.entity_description.key for e in box},
+        node_by_id=node_by_id,
+    )
 
-    @pytest.mark.asyncio
-    async def test_creates_box_sensors(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+# ── async_setup_entry ─────────────────────────────────────────────────
 
-        box_entities = [e for e in added_entities if isinstance(e, DucoboxSensorEntity)]
-        # Should have one entity per SENSORS entry that exists in the data
-        assert len(box_entities) > 0
-        assert len(box_entities) <= len(SENSORS)
+class TestAsyncSetupEntry:
 
-    @pytest.mark.asyncio
-    async def test_creates_node_sensors(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
+    def test_creates_entities(self, setup_result):
+        assert len(setup_result.all) > 0
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    def test_creates_box_sensors(self, setup_result):
+        # Should have one entity per SENSORS entry that exists in the data
+        assert len(setup_result.box) > 0
+        assert len(setup_result.box) <= len(SENSORS)
 
-        node_entities = [e for e in added_entities if isinstance(e, DucoboxNodeSensorEntity)]
+    def test_creates_node_sensors(self, setup_result):
         # 5 nodes in the fixture; each with varying numbers of sensors
-        assert len(node_entities) > 0
-
-    @pytest.mark.asyncio
-    async def test_box_entities_have_unique_ids(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        box_entities = [e for e in added_entities if isinstance(e, DucoboxSensorEntity)]
-        unique_ids = [e._attr_unique_id for e in box_entities]
-        assert len(unique_ids) == len(set(unique_ids)), "Duplicate unique IDs found"
-
-    @pytest.mark.asyncio
-    async def test_node_entities_have_unique_ids(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
+        assert len(setup_result.node) > 0
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    def test_box_entities_have_unique_ids(self, setup_result):
+        assert_all_unique(e._attr_unique_id for e in setup_result.box)
 
-        node_entities = [e for e in added_entities if isinstance(e, DucoboxNodeSensorEntity)]
-        unique_ids = [e._attr_unique_id for e in node_entities]
-        assert len(unique_ids) == len(set(unique_ids)), "Duplicate unique IDs found"
+    def test_node_entities_have_unique_ids(self, setup_result):
+        assert_all_unique(e._attr_unique_id for e in setup_result.node)
 
-    @pytest.mark.asyncio
-    async def test_skips_sensors_missing_from_data(self, mock_hass, mock_entry, mock_coordinator):
+    async def test_skips_sensors_missing_from_data(self, coordinator_data_no_nightboost, mock_entry):
         """Sensors whose data_path doesn't exist in the API response are skipped."""
-        hass, _ = mock_hass
-        # Remove some data to test the skip logic
-        del mock_coordinator.data['info']['NightBoost']
-
-        added_entities = []
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+        added_entities = await _setup(coordinator_data_no_nightboost, mock_entry)
 
         box_keys = {e.entity_description.key for e in added_entities
                     if isinstance(e, DucoboxSensorEntity)}
@@ -123,63 +99,29 @@ class TestAsyncSetupEntry:
         assert 'NightBoostTempComfort' not in box_keys
         assert 'NightBoostTempZone1' not in box_keys
 
-    @pytest.mark.asyncio
-    async def test_returns_on_unknown_mac(self, mock_hass, mock_entry, mock_coordinator):
+    async def test_returns_on_unknown_mac(self, coordinator_data_no_mac, mock_entry):
         """If MAC is unknown, no entities should be added."""
-        hass, _ = mock_hass
-        # Remove the MAC address
-        mock_coordinator.data['info']['General']['Lan']['Mac'] = {'Val': None}
-
-        added_entities = []
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+        added_entities = await _setup(coordinator_data_no_mac, mock_entry)
 
         # When mac is "unknown_mac" (because Val is None), setup returns early
         assert len(added_entities) == 0
 
-    @pytest.mark.asyncio
-    async def test_bsrh_node_has_sensors(self, mock_hass, mock_entry, mock_coordinator):
+    def test_bsrh_node_has_sensors(self, setup_result):
         """Regression test: BSRH nodes must have Temp, Rh, IaqRh sensors."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        # Find BSRH node entities (node 58)
-        bsrh_entities = [
-            e for e in added_entities
-            if isinstance(e, DucoboxNodeSensorEntity) and e._node_id == 58
-        ]
-        bsrh_keys = {e.entity_description.sensor_key for e in bsrh_entities}
+        # BSRH is node 58
+        bsrh_keys = setup_result.node_by_id[58]
 
         assert 'Sensor_Temp' in bsrh_keys, "BSRH missing Temperature sensor"
         assert 'Sensor_Rh' in bsrh_keys, "BSRH missing Relative Humidity sensor"
         assert 'Sensor_IaqRh' in bsrh_keys, "BSRH missing Humidity IAQ sensor"
 
-    @pytest.mark.asyncio
-    async def test_ucco2_node_has_co2(self, mock_hass, mock_entry, mock_coordinator):
+    def test_ucco2_node_has_co2(self, setup_result):
         """UCCO2 nodes must have CO₂ sensor."""
-        hass, _ = mock_hass
-        added_entities = []
+        assert {'Sensor_Co2', 'Sensor_IaqCo2'} <= setup_result.node_by_id[3]
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        ucco2_entities = [
-            e for e in added_entities
-            if isinstance(e, DucoboxNodeSensorEntity) and e._node_id == 3
-        ]
-        ucco2_keys = {e.entity_description.sensor_key for e in ucco2_entities}
-
-        assert 'Sensor_Co2' in ucco2_keys
-        assert 'Sensor_IaqCo2' in ucco2_keys
-
-    @pytest.mark.asyncio
-    async def test_handles_no_nodes(self, mock_hass, mock_entry, mock_coordinator):
+    async def test_handles_no_nodes(self, coordinator_data_no_nodes, mock_entry):
         """If no nodes in data, only box sensors are created."""
-        hass, _ = mock_hass
-        mock_coordinator.data['nodes'] = None
-
-        added_entities = []
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+        added_entities = await _setup(coordinator_data_no_nodes, mock_entry)
 
         node_entities = [e for e in added_entities if isinstance(e, DucoboxNodeSensorEntity)]
         box_entities = [e for e in added_entities if isinstance(e, DucoboxSensorEntity)]
@@ -187,16 +129,7 @@ class TestAsyncSetupEntry:
         assert len(node_entities) == 0
         assert len(box_entities) > 0
 
-    @pytest.mark.asyncio
-    async def test_device_info_contains_model(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        box_entity = next(
-            e for e in added_entities if isinstance(e, DucoboxSensorEntity)
-        )
-        di = box_entity._attr_device_info
+    def test_device_info_contains_model(self, setup_result):
+        di = setup_result.box[0]._attr_device_info
         assert 'ENERGY' in di['model']
         assert 'COMFORT' in di['model']
@@ -1,7 +1,8 @@
 """Tests for switch.py — boolean config parameter switch entities."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock, AsyncMock
 
 from custom_components.ducobox_connectivity_board.switch import (
     async_setup_entry,
@@ -9,31 +10,52 @@ from custom_components.ducobox_connectivity_board.switch import (
     _is_boolean_param,
 )
 from custom_components.ducobox_connectivity_board.const import DOMAIN
+from tests.helpers import assert_all_unique, collect_entities
+from tests.stubs import StubCoordinator
 
 
-@pytest.fixture
-def mock_coordinator(coordinator_data):
-    coord = MagicMock()
-    coord.data = coordinator_data
-    coord.last_update_success = True
-    coord.async_set_box_config = AsyncMock()
-    coord.async_request_refresh = AsyncMock()
-    return coord
+_MONDAY_UID = 'aabbccddeeff-config-VentCool-General-EnableMonday'
+_TEMP_DEP_UID = 'aabbccddeeff-config-Ventilation-Ctrl-TempDepEnable'
 
 
-@pytest.fixture
-def mock_hass(mock_coordinator):
-    hass = MagicMock()
-    entry_data = {'coordinator': mock_coordinator}
-    hass.data = {DOMAIN: {'test_entry': entry_data}}
-    return hass, entry_data
+@pytest.fixture(scope="module")
+def mock_entry():
+    return SimpleNamespace(entry_id='test_entry')
+
+
+def _make_env(data, entry):
+    coord = StubCoordinator(data)
+    hass = SimpleNamespace(data={DOMAIN: {'test_entry': {'coordinator': coord}}})
+    return SimpleNamespace(hass=hass, entry=entry, coord=coord)
+
+
+@pytest.fixture(scope="module")
+def shared_env(coordinator_data, mock_entry):
+    """Module-wide env over the shared, read-only coordinator_data."""
+    return _make_env(coordinator_data, mock_entry)
+
+
+@pytest.fixture(scope="module")
+async def switch_entities(shared_env):
+    """Switch entities from a single async_setup_entry run, shared by the module."""
+    return await collect_entities(async_setup_entry, shared_env.hass, shared_env.entry)
+
+
+@pytest.fixture(scope="module")
+def by_uid(switch_entities):
+    return {e._attr_unique_id: e for e in switch_entities}
 
 
 @pytest.fixture
-def mock_entry():
-    entry = MagicMock()
-    entry.entry_id = 'test_entry'
-    return entry
+async def fresh_env(coordinator_data, mock_entry):
+    """Per-test env with an empty call log and its own entities by uid.
+
+    For tests that assert on the coordinator's calls.
+    """
+    env = _make_env(coordinator_data, mock_entry)
+    entities = await collect_entities(async_setup_entry, env.hass, env.entry)
+    env.by_uid = {e._attr_unique_id: e for e in entities}
+    return env
 
 
 class TestIsBooleanParam:
@@ -52,115 +74,73 @@ class TestIsBooleanParam:
 
 class TestSwitchSetupEntry:
 
-    @pytest.mark.asyncio
-    async def test_creates_switch_entities(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
+    def test_creates_switch_entities(self, switch_entities):
+        assert len(switch_entities) > 0
+        assert all(isinstance(e, DucoboxBoxSwitchEntity) for e in switch_entities)
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        assert len(added_entities) > 0
-        assert all(isinstance(e, DucoboxBoxSwitchEntity) for e in added_entities)
-
-    @pytest.mark.asyncio
-    async def test_boolean_params_become_switches(self, mock_hass, mock_entry, mock_coordinator):
+    def test_boolean_params_become_switches(self, by_uid):
         """All Min=0/Max=1 params outside skip lists should be switches."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        uids = {e._attr_unique_id for e in added_entities}
-        # VentCool day-of-week enables
-        assert any('EnableMonday' in uid for uid in uids)
-        assert any('EnableSunday' in uid for uid in uids)
-        # NightBoost enable
-        assert any('NightBoost' in uid and 'Enable' in uid for uid in uids)
-        # HeatRecovery booleans
-        assert any('Adaptive' in uid for uid in uids)
-        assert any('PassiveHouse' in uid for uid in uids)
-        # Ventilation booleans
-        assert any('TempDepEnable' in uid for uid in uids)
-        assert any('GroundBound' in uid for uid in uids)
-        # General.Time.Dst
-        assert any('Dst' in uid for uid in uids)
-
-    @pytest.mark.asyncio
-    async def test_excludes_skipped_submodules(self, mock_hass, mock_entry, mock_coordinator):
+        # Each entry lists substrings that must all occur in a single uid.
+        required = {
+            # VentCool day-of-week enables
+            ('EnableMonday',), ('EnableSunday',),
+            # NightBoost enable
+            ('NightBoost', 'Enable'),
+            # HeatRecovery booleans
+            ('Adaptive',), ('PassiveHouse',),
+            # Ventilation booleans
+            ('TempDepEnable',), ('GroundBound',),
+            # General.Time.Dst
+            ('Dst',),
+        }
+        found = set()
+        for uid in by_uid:
+            found.update(req for req in required if all(part in uid for part in req))
+        assert found == required, f"missing: {required - found}"
+
+    def test_excludes_skipped_submodules(self, by_uid):
         """Boolean params in skipped submodules should not appear."""
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        uids = {e._attr_unique_id for e in added_entities}
+        uids = by_uid.keys()
         # DowngradeAllow (Firmware.General) is skipped
         assert not any('DowngradeAllow' in uid for uid in uids)
         # Azure.Connection.Enable is skipped
         assert not any('Azure' in uid for uid in uids)
 
-    @pytest.mark.asyncio
-    async def test_unique_ids_unique(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        uids = [e._attr_unique_id for e in added_entities]
-        assert len(uids) == len(set(uids))
-
-    @pytest.mark.asyncio
-    async def test_skips_on_unknown_mac(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        mock_coordinator.data['info']['General']['Lan']['Mac'] = {'Val': None}
-        added_entities = []
+    def test_unique_ids_unique(self, switch_entities):
+        assert_all_unique(e._attr_unique_id for e in switch_entities)
 
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+    async def test_skips_on_unknown_mac(self, coordinator_data_no_mac, mock_entry):
+        env = _make_env(coordinator_data_no_mac, mock_entry)
+        added_entities = await collect_entities(async_setup_entry, env.hass, env.entry)
 
         assert len(added_entities) == 0
 
 
 class TestBoxSwitchEntity:
 
-    @pytest.mark.asyncio
-    async def test_is_on_reads_from_coordinator(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        # Find EnableMonday (Val=0 → off)
-        monday = next(e for e in added_entities if 'EnableMonday' in e._attr_unique_id)
+    def test_is_on_reads_from_coordinator(self, by_uid):
+        # EnableMonday (Val=0 → off)
+        monday = by_uid[_MONDAY_UID]
         assert monday.is_on is False
 
-        # Find TempDepEnable (Val=1 → on)
-        temp_dep = next(e for e in added_entities if 'TempDepEnable' in e._attr_unique_id)
+        # TempDepEnable (Val=1 → on)
+        temp_dep = by_uid[_TEMP_DEP_UID]
         assert temp_dep.is_on is True
 
-    @pytest.mark.asyncio
-    async def test_turn_on(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
-
-        monday = next(e for e in added_entities if 'EnableMonday' in e._attr_unique_id)
+    async def test_turn_on(self, fresh_env):
+        monday = fresh_env.by_uid[_MONDAY_UID]
         await monday.async_turn_on()
 
-        mock_coordinator.async_set_box_config.assert_called_with(
-            'VentCool', 'General', 'EnableMonday', 1
-        )
-
-    @pytest.mark.asyncio
-    async def test_turn_off(self, mock_hass, mock_entry, mock_coordinator):
-        hass, _ = mock_hass
-        added_entities = []
-
-        await async_setup_entry(hass, mock_entry, lambda e: added_entities.extend(e))
+        assert fresh_env.coord.calls == [
+            ('async_set_box_config', ('VentCool', 'General', 'EnableMonday', 1), {}),
+            ('async_request_refresh', (), {}),
+        ]
 
-        temp_dep = next(e for e in added_entities if 'TempDepEnable' in e._attr_unique_id)
+    async def test_turn_off(self, fresh_env):
+        temp_dep = fresh_env.by_uid[_TEMP_DEP_UID]
         await temp_dep.async_turn_off()
 
-        mock_coordinator.async_set_box_config.assert_called_with(
-            'Ventilation', 'Ctrl', 'TempDepEnable', 0
-        )
+        assert fresh_env.coord.calls == [
+            ('async_set_box_config', ('Ventilation', 'Ctrl', 'TempDepEnable', 0), {}),
+            ('async_request_refresh', (), {}),
+        ]
@@ -16,9 +16,30 @@ from custom_components.ducobox_connectivity_board.model.utils import (
     process_bypass_position,
 )
 
+from hypothesis import example, given, settings, strategies as st
 import pytest
 
 
+# Strategies for the safe_get / extract_val property tests.
+_KEYS = st.one_of(st.text(max_size=8), st.integers())
+_LEAVES = st.one_of(st.none(), st.integers(), st.floats(allow_nan=False), st.text(max_size=8))
+
+# These helpers are tiny; a handful of generated cases per property is plenty
+# and keeps this module about as fast as plain example tests.
+_SETTINGS = settings(max_examples=10)
+
+_PASSTHROUGH_FNS = [
+    process_node_temperature,
+    process_node_humidity,
+    process_node_co2,
+    process_node_iaq,
+    process_speed,
+    process_rssi,
+    process_uptime,
+    process_timefilterremain,
+]
+
+
 # ── safe_get ──────────────────────────────────────────────────────────
 
 class TestSafeGet:
@@ -27,9 +48,19 @@ class TestSafeGet:
     def test_single_level(self):
         assert safe_get({'a': 1}, 'a') == 1
 
-    def test_nested(self):
-        data = {'a': {'b': {'c': 42}}}
-        assert safe_get(data, 'a', 'b', 'c') == 42
+    def test_integer_key_on_dict(self):
+        """Dicts can have integer keys; safe_get should handle them."""
+        data = {0: 'zero', 1: 'one'}
+        assert safe_get(data, 0) == 'zero'
+
+    @_SETTINGS
+    @given(path=st.lists(_KEYS, max_size=5), leaf=_LEAVES)
+    @example(path=[], leaf={'hello': 'world'})
+    def test_nested(self, path, leaf):
+        data = leaf
+        for key in reversed(path):
+            data = {key: data}
+        assert safe_get(data, *path) is leaf
 
     def test_missing_key_returns_none(self):
         assert safe_get({'a': 1}, 'b') is None
@@ -37,13 +68,6 @@ class TestSafeGet:
     def test_missing_deep_key_returns_none(self):
         assert safe_get({'a': {'b': 1}}, 'a', 'x') is None
 
-    def test_intermediate_not_dict_returns_none(self):
-        assert safe_get({'a': 42}, 'a', 'b') is None
-
-    def test_empty_keys_returns_data(self):
-        data = {'hello': 'world'}
-        assert safe_get(data) == data
-
     def test_none_data(self):
         assert safe_get(None, 'a') is None
 
@@ -51,10 +75,8 @@ class TestSafeGet:
         """safe_get works on dicts, not lists."""
         assert safe_get([1, 2, 3], 0) is None
 
-    def test_integer_key_on_dict(self):
-        """Dicts can have integer keys; safe_get should handle them."""
-        data = {0: 'zero', 1: 'one'}
-        assert safe_get(data, 0) == 'zero'
+    def test_intermediate_not_dict_returns_none(self):
+        assert safe_get({'a': 42}, 'a', 'b') is None
 
     def test_val_pattern(self):
         """Typical API pattern: dict with 'Val' key."""
@@ -73,38 +95,27 @@ class TestSafeGet:
 class TestExtractVal:
     """Tests for extract_val(), which unwraps {'Val': x} dicts."""
 
-    def test_unwraps_val_dict(self):
-        assert extract_val({'Val': 42}) == 42
-
-    def test_unwraps_val_float(self):
-        assert extract_val({'Val': 19.7}) == 19.7
-
-    def test_unwraps_val_string(self):
-        assert extract_val({'Val': 'AUTO'}) == 'AUTO'
-
-    def test_unwraps_val_zero(self):
-        """Zero is a valid Val."""
-        assert extract_val({'Val': 0}) == 0
+    @_SETTINGS
+    @given(val=_LEAVES, extras=st.dictionaries(_KEYS.filter(lambda k: k != 'Val'), _LEAVES))
+    @example(val=0, extras={})
+    @example(val=None, extras={})
+    @example(val='AUTO', extras={})
+    @example(val=10, extras={'Min': 0, 'Max': 100})
+    def test_unwraps_val(self, val, extras):
+        """Val is extracted whatever its value and whatever else the dict holds."""
+        assert extract_val({**extras, 'Val': val}) is val
 
-    def test_unwraps_val_none(self):
-        """None is a valid Val."""
-        assert extract_val({'Val': None}) is None
+    @pytest.mark.parametrize('data', [None, 42, 'hello', [1, 2, 3]])
+    def test_passthrough_non_dict(self, data):
+        assert extract_val(data) is data
 
-    def test_passthrough_non_dict(self):
-        assert extract_val(42) == 42
-        assert extract_val('hello') == 'hello'
+    def test_unwraps_val_dict(self):
+        assert extract_val({'Val': 42}) == 42
 
     def test_passthrough_dict_without_val(self):
         d = {'Other': 5}
         assert extract_val(d) == d
 
-    def test_passthrough_none(self):
-        assert extract_val(None) is None
-
-    def test_dict_with_val_and_extras(self):
-        """Even if the dict has more keys, Val is extracted."""
-        assert extract_val({'Val': 10, 'Min': 0, 'Max': 100}) == 10
-
 
 # ── process_temperature ──────────────────────────────────────────────
 
@@ -172,50 +183,8 @@ class TestProcessBypassPosition:
 class TestPassthroughProcessors:
     """Node processing functions pass values through unchanged."""
 
-    @pytest.mark.parametrize(
-        "fn",
-        [
-            process_node_temperature,
-            process_node_humidity,
-            process_node_co2,
-            process_node_iaq,
-            process_speed,
-            process_rssi,
-            process_uptime,
-            process_timefilterremain,
-        ],
-    )
-    def test_passthrough_value(self, fn):
-        assert fn(42) == 42
-
-    @pytest.mark.parametrize(
-        "fn",
-        [
-            process_node_temperature,
-            process_node_humidity,
-            process_node_co2,
-            process_node_iaq,
-            process_speed,
-            process_rssi,
-            process_uptime,
-            process_timefilterremain,
-        ],
-    )
-    def test_passthrough_none(self, fn):
-        assert fn(None) is None
-
-    @pytest.mark.parametrize(
-        "fn",
-        [
-            process_node_temperature,
-            process_node_humidity,
-            process_node_co2,
-            process_node_iaq,
-            process_speed,
-            process_rssi,
-            process_uptime,
-            process_timefilterremain,
-        ],
-    )
-    def test_passthrough_float(self, fn):
-        assert fn(19.7) == 19.7
+    def test_passthrough(self):
+        for fn in _PASSTHROUGH_FNS:
+            assert fn(42) == 42, fn.__name__
+            assert fn(19.7) == 19.7, fn.__name__
+            assert fn(None) is None, fn.__name__